@@ -0,0 +1,144 @@
+"""Atributos de los estudiantes: normalización de columnas y tablas de atributos.
+
+Se puede importar sin leer el CSV ni dibujar nada; build_bipartite_graph.py
+lo usa para armar el grafo bipartito.
+"""
+import numpy as np
+import pandas as pd
+
+# Tablas para borrar comillas en una sola pasada con str.translate
+STRIP_QUOTES = str.maketrans("", "", "'\"")
+STRIP_SINGLE_QUOTES = str.maketrans("", "", "'")
+
+# Funciones auxiliares para normalizar columnas enteras
+def normalize_column(column):
+    """Normaliza una columna de texto del dataset"""
+    return column.astype(str).str.strip().str.lower().str.translate(STRIP_QUOTES)
+
+def numeric_column(column):
+    """Convierte una columna a float; los valores inválidos quedan como NaN"""
+    # Se mantiene float64: en float32 un valor como 3.00000001 se redondea a
+    # 3.0 y cambia de intervalo en los atributos numéricos
+    return pd.to_numeric(column, errors="coerce")
+
+def text_column(column):
+    """Limpia una columna de texto sin cambiar mayúsculas"""
+    return column.astype(str).str.strip().str.translate(STRIP_SINGLE_QUOTES)
+
+# Categorías de sueño; cada estudiante queda representado por el índice de la suya (-1 si no figura)
+SLEEP_CATEGORIES = ["Less than 5 hours", "5-6 hours", "7-8 hours", "More than 8 hours"]
+
+def sleep_codes(*categories):
+    """Índices en SLEEP_CATEGORIES de las categorías dadas"""
+    return np.array([SLEEP_CATEGORIES.index(category) for category in categories], dtype=np.int8)
+
+def normalize_distinct(column, normalize):
+    """Normaliza sólo los valores distintos de la columna y devuelve una categórica con una entrada por fila"""
+    codes, values = pd.factorize(column, use_na_sentinel=False)
+    return pd.Categorical(normalize(pd.Series(values, dtype=object))).take(codes)
+
+# Columnas normalizadas una única vez, compartidas por todos los atributos.
+# Las de texto se normalizan sobre sus valores distintos, no fila por fila, y
+# los atributos de una misma columna (p. ej. GenderFemale y GenderMale)
+# comparan contra los mismos códigos.
+def prepare_columns(data):
+    """Agrega al dataset las columnas ya normalizadas que leen los atributos"""
+    data["_gender_n"] = normalize_distinct(data["Gender"], normalize_column)
+    data["_age_f"] = numeric_column(data["Age"])
+    data["_ap_f"] = numeric_column(data["Academic Pressure"])
+    data["_ss_f"] = numeric_column(data["Study Satisfaction"])
+    codes, sleep = pd.factorize(data["Sleep Duration"], use_na_sentinel=False)
+    sleep_levels = pd.Index(SLEEP_CATEGORIES).get_indexer(text_column(pd.Series(sleep, dtype=object)))
+    data["_sleep_code"] = sleep_levels.astype(np.int8)[codes]
+    data["_diet_n"] = normalize_distinct(data["Dietary Habits"], text_column)
+    data["_hours_f"] = numeric_column(data["Work/Study Hours"])
+    data["_suicidal_n"] = normalize_distinct(data["Have you ever had suicidal thoughts ?"], text_column)
+    data["_family_n"] = normalize_distinct(data["Family History of Mental Illness"], text_column)
+    data["_depression_n"] = normalize_distinct(data["Depression"], text_column)
+
+# Atributos del grafo, en el orden en que se muestran y guardan. Cada uno es
+# (nombre, tipo, columna, ...) y lo que sigue depende del tipo:
+#   RANGE:  mínimo, máximo, incluye mínimo, incluye máximo
+#   EQUALS: valor
+#   IN_SET: códigos aceptados
+RANGE, EQUALS, IN_SET = "range", "equals", "in_set"
+
+ATTRIBUTES = [
+    # ===== Sueño =====
+    ("HasGoodSleep", IN_SET, "_sleep_code", sleep_codes("7-8 hours", "More than 8 hours")),
+    ("HasBadSleep", IN_SET, "_sleep_code", sleep_codes("Less than 5 hours", "5-6 hours")),
+    # ===== Género =====
+    ("GenderFemale", EQUALS, "_gender_n", "female"),
+    ("GenderMale", EQUALS, "_gender_n", "male"),
+    # ===== Edad =====
+    ("AgeYoung", RANGE, "_age_f", 17.0, 25.0, False, False),
+    ("AgeYoungAdult", RANGE, "_age_f", 24.0, 40.0, False, False),
+    ("AgeAdult", RANGE, "_age_f", 40.0, np.inf, True, False),
+    # ===== Presión Académica =====
+    ("LowAcademicPressure", RANGE, "_ap_f", -np.inf, 3.0, False, False),
+    ("MediumAcademicPressure", RANGE, "_ap_f", 3.0, 3.0, True, True),
+    ("HighAcademicPressure", RANGE, "_ap_f", 3.0, np.inf, False, False),
+    # ===== CGPA =====
+    # ===== Satisfacción académica =====
+    ("LowStudySatisfaction", RANGE, "_ss_f", -np.inf, 3.0, False, False),
+    ("MediumStudySatisfaction", RANGE, "_ss_f", 3.0, 3.0, True, True),
+    ("HighStudySatisfaction", RANGE, "_ss_f", 3.0, np.inf, False, False),
+    # ===== Hábitos alimenticios =====
+    ("UnhealthyDiet", EQUALS, "_diet_n", "Unhealthy"),
+    ("HealthyDiet", EQUALS, "_diet_n", "Healthy"),
+    ("ModerateDiet", EQUALS, "_diet_n", "Moderate"),
+    # ===== Horas de estudio =====
+    ("LowStudyHours", RANGE, "_hours_f", 0.0, 3.0, True, False),
+    ("MediumLowStudyHours", RANGE, "_hours_f", 3.0, 6.0, True, False),
+    ("MediumHighStudyHours", RANGE, "_hours_f", 6.0, 9.0, True, False),
+    ("HighStudyHours", RANGE, "_hours_f", 9.0, 12.0, True, True),
+    # ===== Pensamientos suicidas =====
+    ("HasSuicidalThoughts", EQUALS, "_suicidal_n", "Yes"),
+    ("HasNoSuicidalThoughts", EQUALS, "_suicidal_n", "No"),
+    # ===== Historial familiar de enfermedades mentales =====
+    ("HasFamilyHistoryOfMentalIllness", EQUALS, "_family_n", "Yes"),
+    ("HasNoFamilyHistoryOfMentalIllness", EQUALS, "_family_n", "No"),
+    # ===== Depresión =====
+    ("IsDepressed", EQUALS, "_depression_n", "Yes"),
+    ("IsNotDepressed", EQUALS, "_depression_n", "No"),
+]
+
+# REVISAR: FALTAN ATRIBUTOS DE CITY, DEGREE Y CGPA
+
+# Nodos de atributos del grafo
+ATTRIBUTE_NODES = [attr[0] for attr in ATTRIBUTES]
+
+def attributes_of_kind(kind):
+    """Devuelve (posiciones, entradas) de los atributos de un tipo, con cada
+    entrada como (nombre, columna, ...), sin el tipo"""
+    positions = [j for j, attr in enumerate(ATTRIBUTES) if attr[1] == kind]
+    return positions, [(ATTRIBUTES[j][0],) + ATTRIBUTES[j][2:] for j in positions]
+
+# Tablas por tipo y columna de compute_masks que le toca a cada entrada
+NUMERIC_POSITIONS, NUMERIC_ATTRS = attributes_of_kind(RANGE)
+CATEGORICAL_POSITIONS, CATEGORICAL_ATTRS = attributes_of_kind(EQUALS)
+SET_POSITIONS, SET_ATTRS = attributes_of_kind(IN_SET)
+
+# Límites de los atributos numéricos, armados una sola vez para compute_range_masks
+RANGE_COLUMNS = [column for _, column, *_ in NUMERIC_ATTRS]
+RANGE_LOWER = np.array([attr[2] for attr in NUMERIC_ATTRS], dtype=np.float64)
+RANGE_UPPER = np.array([attr[3] for attr in NUMERIC_ATTRS], dtype=np.float64)
+RANGE_LOWER_INCLUSIVE = np.array([attr[4] for attr in NUMERIC_ATTRS])
+RANGE_UPPER_INCLUSIVE = np.array([attr[5] for attr in NUMERIC_ATTRS])
+
+def compute_range_masks(data):
+    """Evalúa todos los atributos numéricos en una sola pasada; devuelve una matriz (estudiantes x atributos)"""
+    values = np.column_stack([data[column].to_numpy(dtype=np.float64) for column in RANGE_COLUMNS])
+    aboveLower = np.where(RANGE_LOWER_INCLUSIVE, values >= RANGE_LOWER, values > RANGE_LOWER)
+    belowUpper = np.where(RANGE_UPPER_INCLUSIVE, values <= RANGE_UPPER, values < RANGE_UPPER)
+    return aboveLower & belowUpper
+
+def compute_masks(data):
+    """Matriz booleana (estudiantes x atributos), con columnas en el orden de ATTRIBUTE_NODES"""
+    masks = np.empty((len(data), len(ATTRIBUTE_NODES)), dtype=bool, order="F")
+    masks[:, NUMERIC_POSITIONS] = compute_range_masks(data)
+    for (_, column, value), j in zip(CATEGORICAL_ATTRS, CATEGORICAL_POSITIONS):
+        masks[:, j] = (data[column] == value).to_numpy()
+    for (_, column, codes), j in zip(SET_ATTRS, SET_POSITIONS):
+        masks[:, j] = np.isin(data[column].to_numpy(), codes)
+    return masks
@@ -1,416 +1,298 @@
+import os
+import random
 import sys
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+import scipy.sparse as sp
 import networkx as nx
 import matplotlib.pyplot as plt
 
+from attributes import ATTRIBUTE_NODES, compute_masks, prepare_columns
+
 # ==========================
-# 1. Read CSV path and optional sample percentage from argv
+# 1. Read CSV path, optional sample percentage and flags from argv
 # ==========================
-if len(sys.argv) < 2:
-    print("Usage: python build_bipartite_graph.py <path_to_csv> [sample_percentage]")
-    sys.exit(1)
+# --draw guarda un dibujo del grafo (con una muestra de estudiantes);
+# --publish lo guarda en alta resolución
+FLAGS = {"--draw", "--publish"}
 
-csv_path = sys.argv[1]
+def parse_args(argv):
+    """Devuelve (csv_path, sample_percentage, draw, publish)"""
+    flags = {arg for arg in argv if arg.startswith("--")}
+    args = [arg for arg in argv if not arg.startswith("--")]
 
-# Default sample percentage = 100%
-sample_percentage = 100
-if len(sys.argv) >= 3:
-    try:
-        sample_percentage = float(sys.argv[2])
-        if not (0 <= sample_percentage <= 100):
-            raise ValueError
-    except ValueError:
-        print("Error: sample_percentage must be a number between 0 and 100")
+    if len(args) < 1 or not flags <= FLAGS:
+        print("Usage: python build_bipartite_graph.py <path_to_csv> [sample_percentage] [--draw] [--publish]")
         sys.exit(1)
 
-# ==========================
-# 2. Read dataset
-# ==========================
-try:
-    data = pd.read_csv(csv_path)
-except FileNotFoundError:
-    print(f"Error: File '{csv_path}' not found.")
-    sys.exit(1)
+    csv_path = args[0]
 
-# ==========================
-# 3. Sample students if needed
-# ==========================
-if sample_percentage < 100:
-    data = data.sample(frac=sample_percentage / 100, random_state=42).reset_index(drop=True)
+    # Default sample percentage = 100%
+    sample_percentage = 100
+    if len(args) >= 2:
+        try:
+            sample_percentage = float(args[1])
+            if not (0 <= sample_percentage <= 100):
+                raise ValueError
+        except ValueError:
+            print("Error: sample_percentage must be a number between 0 and 100")
+            sys.exit(1)
 
-students = data["id"].astype(str).tolist()
+    return csv_path, sample_percentage, "--draw" in flags, "--publish" in flags
 
 # ==========================
-# 4. Define Attribute classes
+# 2. Read dataset (in chunks, to keep memory bounded)
 # ==========================
-class Attribute:
-    def getName(self):
-        raise NotImplementedError
-
-    def matchesStudent(self, student):
-        raise NotImplementedError
-
-# Función auxiliar para normalizar valores
-def normalize_value(value):
-    """Normaliza cualquier valor del dataset"""
-    if value is None:
-        return None
-    return str(value).strip().lower().replace("'", "").replace('"', '')
-
-# ===== Género =====
-
-class IsFemale(Attribute):
-    def getName(self):
-        return "GenderFemale"
-
-    def matchesStudent(self, student):
-        gender = normalize_value(student["Gender"])
-        return gender == "female"
-
-class IsMale(Attribute):
-    def getName(self):
-        return "GenderMale"
-
-    def matchesStudent(self, student):
-        gender = normalize_value(student["Gender"])
-        return gender == "male"
-
-# ===== Edad =====
-
-class IsYoung(Attribute):
-    def getName(self):
-        return "AgeYoung"
-    
-    def matchesStudent(self, student):
-        try:
-            age = float(student["Age"])
-            return 17 < age < 25
-        except (ValueError, TypeError):
-            return False
-
-class IsYoungAdult(Attribute):
-    def getName(self):
-        return "AgeYoungAdult"
-    
-    def matchesStudent(self, student):
-        try:
-            age = float(student["Age"])
-            return 24 < age < 40
-        except (ValueError, TypeError):
-            return False
-        
-class IsAdult(Attribute):
-    def getName(self):
-        return "AgeAdult"
-    
-    def matchesStudent(self, student):
-        try:
-            age = float(student["Age"])
-            return age >= 40
-        except (ValueError, TypeError):
-            return False
-        
-# ===== Presión Académica =====
-
-class HasLowAcademicPressure(Attribute):
-    def getName(self):
-        return "LowAcademicPressure"
-    
-    def matchesStudent(self, student):
-        try:
-            academicPressure = float(student["Academic Pressure"])
-            return academicPressure < 3.0
-        except (ValueError, TypeError):
-            return False
-
-class HasMediumAcademicPressure(Attribute):
-    def getName(self):
-        return "MediumAcademicPressure"
-    
-    def matchesStudent(self, student):
-        try:
-            academicPressure = float(student["Academic Pressure"])
-            return academicPressure == 3.0
-        except (ValueError, TypeError):
-            return False
-
-class HasHighAcademicPressure(Attribute):
-    def getName(self):
-        return "HighAcademicPressure"
-    
-    def matchesStudent(self, student):
-        try:
-            academicPressure = float(student["Academic Pressure"])
-            return academicPressure > 3.0
-        except (ValueError, TypeError):
-            return False
-
-# ===== CGPA =====
-
+# Tamaño en bytes de cada bloque que pyarrow lee y convierte (en varios hilos)
+BLOCK_SIZE = 16 << 20
+
+# Sólo se leen las columnas que usan los atributos
+USED_COLUMNS = [
+    "id",
+    "Gender",
+    "Age",
+    "Academic Pressure",
+    "Study Satisfaction",
+    "Sleep Duration",
+    "Dietary Habits",
+    "Work/Study Hours",
+    "Have you ever had suicidal thoughts ?",
+    "Family History of Mental Illness",
+    "Depression",
+]
+# Las columnas numéricas se leen como texto y las convierte numeric_column(),
+# que deja como NaN los valores inválidos en lugar de abortar la lectura
+CATEGORY = pa.dictionary(pa.int32(), pa.string())
+COLUMN_TYPES = {
+    "id": pa.string(),
+    "Gender": CATEGORY,
+    "Age": pa.string(),
+    "Academic Pressure": pa.string(),
+    "Study Satisfaction": pa.string(),
+    "Sleep Duration": CATEGORY,
+    "Dietary Habits": CATEGORY,
+    "Work/Study Hours": pa.string(),
+    "Have you ever had suicidal thoughts ?": CATEGORY,
+    "Family History of Mental Illness": CATEGORY,
+    "Depression": CATEGORY,
+}
+
+# Cache en formato Arrow IPC (stream) con las columnas ya parseadas, junto al
+# CSV; se usa mientras sea más nuevo que el CSV y tenga el mismo esquema. Es
+# stream y no Feather porque cada bloque trae su propio diccionario de
+# categorías, y el formato de archivo Feather admite uno solo por columna.
+CACHE_SUFFIX = ".arrows"
+CACHE_SCHEMA = pa.schema([(column, COLUMN_TYPES[column]) for column in USED_COLUMNS])
+
+def open_reader(csv_path):
+    """Abre el CSV para leerlo de a bloques (record batches de pyarrow)"""
+    try:
+        return pacsv.open_csv(
+            csv_path,
+            read_options=pacsv.ReadOptions(block_size=BLOCK_SIZE),
+            convert_options=pacsv.ConvertOptions(include_columns=USED_COLUMNS, column_types=COLUMN_TYPES),
+        )
+    except FileNotFoundError:
+        print(f"Error: File '{csv_path}' not found.")
+        sys.exit(1)
 
-# ===== Satisfacción académica =====
+def read_cache(cache_path):
+    """Itera los bloques del cache, mapeado en memoria"""
+    with pa.memory_map(cache_path) as source:
+        yield from pa.ipc.open_stream(source)
 
-class HasLowStudySatisfaction(Attribute):
-    def getName(self):
-        return "LowStudySatisfaction"
-    
-    def matchesStudent(self, student):
-        try:
-            studySatisfaction = float(student["Study Satisfaction"])
-            return studySatisfaction < 3.0
-        except (ValueError, TypeError):
-            return False
-
-class HasMediumStudySatisfaction(Attribute):
-    def getName(self):
-        return "MediumStudySatisfaction"
-    
-    def matchesStudent(self, student):
-        try:
-            studySatisfaction = float(student["Study Satisfaction"])
-            return studySatisfaction == 3.0
-        except (ValueError, TypeError):
-            return False
-
-class HasHighStudySatisfaction(Attribute):
-    def getName(self):
-        return "HighStudySatisfaction"
-    
-    def matchesStudent(self, student):
-        try:
-            studySatisfaction = float(student["Study Satisfaction"])
-            return studySatisfaction > 3.0
-        except (ValueError, TypeError):
-            return False
-
-# ===== Sueño =====
-
-class HasGoodSleep(Attribute):
-    def getName(self):
-        return "HasGoodSleep"
-
-    def matchesStudent(self, student):
-        sleep = str(student["Sleep Duration"]).strip().replace("'", "")
-        return sleep in ["7-8 hours", "More than 8 hours"]
-
-
-class HasBadSleep(Attribute):
-    def getName(self):
-        return "HasBadSleep"
-
-    def matchesStudent(self, student):
-        sleep = str(student["Sleep Duration"]).strip().replace("'", "")
-        return sleep in ["Less than 5 hours", "5-6 hours"]
-    
-
-# ===== Hábitos alimenticios =====
-
-class UnhealthyDiet(Attribute):
-    def getName(self):
-        return "UnhealthyDiet"
-    
-    def matchesStudent(self, student):
-        diet = str(student["Dietary Habits"]).strip().replace("'","")
-        return diet == "Unhealthy"
-    
-class HealthyDiet(Attribute):
-    def getName(self):
-        return "HealthyDiet"
-    
-    def matchesStudent(self, student):
-        diet = str(student["Dietary Habits"]).strip().replace("'","")
-        return diet == "Healthy"
-
-class ModerateDiet(Attribute):
-    def getName(self):
-        return "ModerateDiet"
-    
-    def matchesStudent(self, student):
-        diet = str(student["Dietary Habits"]).strip().replace("'","")
-        return diet == "Moderate"
-
-# ===== Horas de estudio =====
-
-class LowStudyHours(Attribute):
-    def getName(self):
-        return "LowStudyHours"
-    
-    def matchesStudent(self, student):
-        try:
-            studyHours = float(student["Work/Study Hours"])
-            return 0.0 <= studyHours < 3.0
-        except (ValueError, TypeError):
-            return False
-        
-class MediumLowStudyHours(Attribute):
-    def getName(self):
-        return "MediumLowStudyHours"
-    
-    def matchesStudent(self, student):
-        try:
-            studyHours = float(student["Work/Study Hours"])
-            return 3.0 <= studyHours < 6.0
-        except (ValueError, TypeError):
-            return False
-        
-class MediumHighStudyHours(Attribute):
-    def getName(self):
-        return "MediumHighStudyHours"
-    
-    def matchesStudent(self, student):
-        try:
-            studyHours = float(student["Work/Study Hours"])
-            return 6.0 <= studyHours < 9.0
-        except (ValueError, TypeError):
-            return False
-        
-class HighStudyHours(Attribute):
-    def getName(self):
-        return "HighStudyHours"
-    
-    def matchesStudent(self, student):
-        try:
-            studyHours = float(student["Work/Study Hours"])
-            return 9.0 <= studyHours <= 12.0
-        except (ValueError, TypeError):
-            return False
-
-# ===== Pensamientos suicidas =====
-
-class HasSuicidalThoughts(Attribute):
-    def getName(self):
-        return "HasSuicidalThoughts"
-    
-    def matchesStudent(self, student):
-        answer = str(student["Have you ever had suicidal thoughts ?"]).strip().replace("'","")
-        return answer == "Yes"
-    
-class HasNoSuicidalThoughts(Attribute):
-    def getName(self):
-        return "HasNoSuicidalThoughts"
-    
-    def matchesStudent(self, student):
-        answer = str(student["Have you ever had suicidal thoughts ?"]).strip().replace("'","")
-        return answer == "No"
-        
-# ===== Historial familiar de enfermedades mentales =====
-
-class HasFamilyHistoryOfMentalIllness(Attribute):
-    def getName(self):
-        return "HasFamilyHistoryOfMentalIllness"
-    
-    def matchesStudent(self, student):
-        answer = str(student["Family History of Mental Illness"]).strip().replace("'","")
-        return answer == "Yes"
-    
-class HasNoFamilyHistoryOfMentalIllness(Attribute):
-    def getName(self):
-        return "HasNoFamilyHistoryOfMentalIllness"
-    
-    def matchesStudent(self, student):
-        answer = str(student["Family History of Mental Illness"]).strip().replace("'","")
-        return answer == "No"
-    
-# ===== Depresión =====
-
-class IsDepressed(Attribute):
-    def getName(self):
-        return "IsDepressed"
-    
-    def matchesStudent(self, student):
-        answer = str(student["Depression"]).strip().replace("'","")
-        return answer == "Yes"
-    
-class IsNotDepressed(Attribute):
-    def getName(self):
-        return "IsNotDepressed"
-    
-    def matchesStudent(self, student):
-        answer = str(student["Depression"]).strip().replace("'","")
-        return answer == "No"
-
-# REVISAR: FALTAN ATRIBUTOS DE CITY, DEGREE Y CGPA
+def read_and_cache(reader, cache_path):
+    """Itera los bloques del CSV y a la vez los escribe en el cache"""
+    tmp_path = cache_path + ".tmp"
+    try:
+        writer = pa.ipc.new_stream(tmp_path, reader.schema)
+    except OSError:
+        # Sin permiso de escritura: se lee el CSV sin cachear
+        yield from reader
+        return
+    with writer:
+        for batch in reader:
+            writer.write_batch(batch)
+            yield batch
+    os.replace(tmp_path, cache_path)
+
+def cache_is_valid(cache_path):
+    """Indica si el cache tiene el esquema esperado y se puede leer completo"""
+    # Recorrer el stream mapeado en memoria no copia los datos; así un cache
+    # truncado o dañado se descarta acá y no a mitad de la corrida
+    try:
+        with pa.memory_map(cache_path) as source:
+            cache = pa.ipc.open_stream(source)
+            if not cache.schema.equals(CACHE_SCHEMA):
+                return False
+            for _ in cache:
+                pass
+    except (pa.ArrowInvalid, OSError):
+        return False
+    return True
+
+def read_batches(csv_path):
+    """Itera el dataset de a bloques, desde el cache si está al día o si no desde el CSV"""
+    cache_path = csv_path + CACHE_SUFFIX
+    if (
+        os.path.exists(csv_path)
+        and os.path.exists(cache_path)
+        and os.path.getmtime(cache_path) >= os.path.getmtime(csv_path)
+    ):
+        if cache_is_valid(cache_path):
+            return read_cache(cache_path)
+    return read_and_cache(open_reader(csv_path), cache_path)
 
 # ==========================
-# 5. Instantiate attribute objects
+# 3. Sample students if needed
 # ==========================
-attributes = [HasGoodSleep(), HasBadSleep(),                                                                # Atributos de sueño
-              IsFemale(), IsMale(),                                                                         # Atributos de género
-              IsYoung(), IsYoungAdult(), IsAdult(),                                                         # Atributos de edad
-              HasLowAcademicPressure(), HasMediumAcademicPressure(), HasHighAcademicPressure(),             # Atributos de presión académica
-              HasLowStudySatisfaction(), HasMediumStudySatisfaction(), HasHighStudySatisfaction(),          # Atributos de satisfacción académica
-              UnhealthyDiet(), HealthyDiet(), ModerateDiet(),                                               # Atributos de hábitos alimenticios
-              LowStudyHours(), MediumLowStudyHours(), MediumHighStudyHours(), HighStudyHours(),             # Atributos de horas de estudio
-              HasSuicidalThoughts(), HasNoSuicidalThoughts(),                                               # Atributos de pensamientos suicidas
-              HasFamilyHistoryOfMentalIllness(), HasNoFamilyHistoryOfMentalIllness(),                       # Atributos de historial de enfermedad mental en la familia
-              IsDepressed(), IsNotDepressed()]
-
-attribute_nodes = [attr.getName() for attr in attributes]
+# Todos los bloques comparten un mismo generador (ver build_matrix): con una
+# semilla por bloque, bloques del mismo largo conservarían las mismas filas
+def sample_students(chunk, sample_percentage, rng):
+    """Toma la muestra de estudiantes de un bloque del CSV"""
+    if sample_percentage < 100:
+        return chunk.sample(frac=sample_percentage / 100, random_state=rng).reset_index(drop=True)
+    return chunk
 
 # ==========================
-# 6. Build the bipartite graph
+# 4. Build the bipartite graph
 # ==========================
-B = nx.Graph()
-B.add_nodes_from(students, bipartite=0)
-B.add_nodes_from(attribute_nodes, bipartite=1)
-
-edges = []
-for _, student in data.iterrows():
-    student_id = str(student["id"])
-    for attr in attributes:
-        if attr.matchesStudent(student):
-            edges.append((student_id, attr.getName()))
-
-B.add_edges_from(edges)
+# Matriz de adyacencia dispersa: filas = estudiantes, columnas = atributos.
+# Cada bloque del CSV se procesa por separado; offset es la fila del primer
+# estudiante del bloque dentro de la matriz. Las aristas se guardan como un
+# bloque (filas, atributo) por atributo en lugar de una tupla por arista.
+def build_matrix(batches, sample_percentage):
+    """Devuelve (M, students, row_ids): la matriz estudiantes x atributos, el id
+    de cada fila de M y el id de cada fila leída del CSV (con repetidos)"""
+    # Con un CSV sin filas no llega ningún bloque; se arranca con listas vacías
+    chunk_ids = [np.empty(0, dtype=object)]
+    edge_blocks = [(np.empty(0, dtype=np.intp), 0)]
+    offset = 0
+    # RandomState(42) hace que con un único bloque la muestra sea la misma que
+    # la de data.sample(random_state=42) sobre todo el dataset
+    rng = np.random.RandomState(42)
+    for batch in batches:
+        chunk = sample_students(batch.to_pandas(), sample_percentage, rng)
+        prepare_columns(chunk)
+        chunk_ids.append(chunk["id"].astype(str).to_numpy())
+        masks = compute_masks(chunk)
+        for j in range(len(ATTRIBUTE_NODES)):
+            edge_blocks.append((np.flatnonzero(masks[:, j]) + offset, j))
+        offset += len(chunk)
+
+    # Cada id distinto pasa a ser un índice entero (ids repetidos comparten nodo)
+    row_ids = np.concatenate(chunk_ids)
+    id_codes, id_uniques = pd.factorize(row_ids)
+    students = id_uniques.tolist()
+
+    rows = id_codes[np.concatenate([idx for idx, _ in edge_blocks])]
+    cols = np.repeat(np.array([j for _, j in edge_blocks], dtype=np.intp), [idx.size for idx, _ in edge_blocks])
+
+    M = sp.coo_matrix(
+        (np.ones(len(rows), dtype=np.uint8), (rows, cols)),
+        shape=(len(students), len(ATTRIBUTE_NODES)),
+    ).tocsr()
+    return M, students, row_ids
 
 # ==========================
-# 7. Print summary
+# 5. Print summary
 # ==========================
-print("\n--- Bipartite Graph Summary ---")
-print(f"Total nodes: {B.number_of_nodes()}")
-print(f"Total edges: {B.number_of_edges()}")
-print(f"Sample students: {students[:5]}")
-print(f"Attributes: {attribute_nodes}")
-print(f"Is bipartite: {nx.is_bipartite(B)}")
+# Cada arista une una fila de M (estudiante) con una columna (atributo), así
+# que el grafo es bipartito por construcción y no hace falta recorrerlo
+def print_summary(M, row_ids):
+    print("\n--- Bipartite Graph Summary ---")
+    print(f"Total nodes: {M.shape[0] + M.shape[1]}")
+    print(f"Total edges: {M.nnz}")
+    print(f"Sample students: {row_ids[:5].tolist()}")
+    print(f"Attributes: {ATTRIBUTE_NODES}")
 
 # ==========================
-# 8. Visualize the graph
+# 6. Save the edge list
 # ==========================
+# Lista de aristas (student, attribute) en Parquet, para analizar el grafo
+# sin volver a procesar el CSV; ambas columnas van codificadas como diccionario
+EDGES_PATH = "bipartite_edges.parquet"
+
+def save_edges(M, students):
+    edges = M.tocoo()
+    edges_table = pa.table({
+        "student": pa.DictionaryArray.from_arrays(edges.row.astype(np.int32), pa.array(students, type=pa.string())),
+        "attribute": pa.DictionaryArray.from_arrays(edges.col.astype(np.int32), pa.array(ATTRIBUTE_NODES)),
+    })
+    pq.write_table(edges_table, EDGES_PATH)
+    print(f"Edges saved to '{EDGES_PATH}'")
 
-plt.figure(figsize=(10, 6))
-
-# Usar layout bipartito para separar los dos conjuntos
-pos = nx.bipartite_layout(B, students)
-
-# Separar nodos por su atributo bipartito
-top_nodes = students
-bottom_nodes = attribute_nodes
-
-# Dibujar nodos de cada conjunto con diferentes colores
-nx.draw_networkx_nodes(
-    B,
-    pos,
-    nodelist=top_nodes,
-    node_color="lightblue",
-    node_size=800,
-    label="Students",
-)
-nx.draw_networkx_nodes(
-    B,
-    pos,
-    nodelist=bottom_nodes,
-    node_color="lightgreen",
-    node_size=800,
-    label="Attributes",
-)
-
-# Dibujar aristas y etiquetas
-nx.draw_networkx_edges(B, pos, edge_color="gray", width=1.5)
-nx.draw_networkx_labels(B, pos, font_size=8, font_weight="bold")
-
-plt.title("Bipartite Graph: Students and Attributes", fontsize=14, fontweight="bold")
-plt.legend(scatterpoints=1, loc="upper right")
-plt.axis("off")
-plt.tight_layout()
-plt.savefig("bipartite_graph.png", dpi=300)
-print("Graph saved to 'bipartite_graph.png'")
+# ==========================
+# 7. Visualize the graph
+# ==========================
+# Dibujar todos los estudiantes tarda minutos y no se llega a leer nada;
+# se dibuja una muestra de a lo sumo DRAW_SAMPLE_SIZE estudiantes
+DRAW_SAMPLE_SIZE = 200
+
+def draw_graph(M, students, publish):
+    # El grafo de NetworkX sólo se arma para la visualización y sólo con la
+    # muestra: se construye de una vez desde la adyacencia en bloques
+    # [[0, S], [S^T, 0]], con S las filas de M de los estudiantes elegidos.
+    # El estudiante i de la muestra queda como el nodo i (sin renombrar, porque
+    # esos índices se pisarían con las filas de M) y su id se usa como etiqueta.
+    students_sample = random.Random(42).sample(range(len(students)), min(DRAW_SAMPLE_SIZE, len(students)))
+    student_nodes = list(range(len(students_sample)))
+    S = M[students_sample]
+    A = sp.bmat([[None, S], [S.T, None]], format="csr")
+    B_vis = nx.from_scipy_sparse_array(A)
+    nx.relabel_nodes(B_vis, {len(student_nodes) + j: name for j, name in enumerate(ATTRIBUTE_NODES)}, copy=False)
+    nx.set_node_attributes(B_vis, {**dict.fromkeys(student_nodes, 0), **dict.fromkeys(ATTRIBUTE_NODES, 1)}, "bipartite")
+    labels = {i: students[code] for i, code in enumerate(students_sample)}
+    labels.update({name: name for name in ATTRIBUTE_NODES})
+
+    plt.figure(figsize=(10, 6))
+
+    # Usar layout bipartito para separar los dos conjuntos
+    pos = nx.bipartite_layout(B_vis, student_nodes)
+
+    # Separar nodos por su atributo bipartito
+    top_nodes = student_nodes
+    bottom_nodes = ATTRIBUTE_NODES
+
+    # Dibujar nodos de cada conjunto con diferentes colores
+    nx.draw_networkx_nodes(
+        B_vis,
+        pos,
+        nodelist=top_nodes,
+        node_color="lightblue",
+        node_size=800,
+        label="Students",
+    )
+    nx.draw_networkx_nodes(
+        B_vis,
+        pos,
+        nodelist=bottom_nodes,
+        node_color="lightgreen",
+        node_size=800,
+        label="Attributes",
+    )
+
+    # Dibujar aristas y etiquetas
+    nx.draw_networkx_edges(B_vis, pos, edge_color="gray", width=1.5)
+    nx.draw_networkx_labels(B_vis, pos, labels=labels, font_size=8, font_weight="bold")
+
+    plt.title("Bipartite Graph: Students and Attributes", fontsize=14, fontweight="bold")
+    plt.legend(scatterpoints=1, loc="upper right")
+    plt.axis("off")
+    plt.tight_layout()
+    plt.savefig("bipartite_graph.png", dpi=300 if publish else 100)
+    print("Graph saved to 'bipartite_graph.png'")
+
+def main():
+    csv_path, sample_percentage, draw, publish = parse_args(sys.argv[1:])
+    M, students, row_ids = build_matrix(read_batches(csv_path), sample_percentage)
+    print_summary(M, row_ids)
+    save_edges(M, students)
+    if draw:
+        draw_graph(M, students, publish)
+
+if __name__ == "__main__":
+    main()